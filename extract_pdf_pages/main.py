@@ -1,5 +1,12 @@
+import asyncio
+import logging
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from pathlib import Path
-from typing import Union, Optional, List, Sequence
+from typing import Iterator, Tuple, Union, Optional, List, Sequence
 from pypdf import PdfReader, PdfWriter
 import typer
 
@@ -7,6 +14,176 @@ app = typer.Typer(
     help="PDF extraction and combination utilities for operating agreements."
 )
 
+logger = logging.getLogger(__name__)
+
+
+@app.callback()
+def main(
+    verbose: bool = typer.Option(
+        False, "--verbose", help="Enable per-file debug output."
+    ),
+):
+    """Configure logging for the CLI commands."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(message)s",
+    )
+
+
+def _list_pdfs(input_file_dir: Path) -> List[Path]:
+    """Lists the PDF files in a directory, sorted for consistency.
+
+    Uses os.scandir with an inline suffix check, which avoids the per-entry
+    Path construction and fnmatch work that Path.glob does.
+    """
+    with os.scandir(input_file_dir) as it:
+        return sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.is_file() and entry.name.lower().endswith(".pdf")
+        )
+
+
+def _prefetch_bytes(
+    paths: List[Path], depth: int = 8
+) -> Iterator[Tuple[Path, bytes]]:
+    """Yields (path, bytes) pairs in order, reading ahead of the consumer.
+
+    A small thread pool keeps up to `depth` file reads in flight while the
+    caller parses the current file, hiding read latency behind parse time.
+    Threads are sufficient here because read_bytes releases the GIL inside
+    the C read call. A file that fails to read is reported and skipped so it
+    doesn't halt the batch.
+    """
+    with ThreadPoolExecutor(max_workers=depth) as io_pool:
+        futures = deque((p, io_pool.submit(p.read_bytes)) for p in paths[:depth])
+        next_index = depth
+        while futures:
+            path, future = futures.popleft()
+            if next_index < len(paths):
+                next_path = paths[next_index]
+                futures.append((next_path, io_pool.submit(next_path.read_bytes)))
+                next_index += 1
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.warning(f"Error processing {path}: {e}")
+                continue
+            yield path, data
+
+
+@lru_cache(maxsize=256)
+def _open_reader(path: str) -> PdfReader:
+    """Returns a cached PdfReader so each source PDF is parsed at most once.
+
+    strict=False skips pypdf's extra validation walks; writers in this module
+    likewise never invoke pypdf's optional object-compression pass, since this
+    workflow only grafts pages. The cache keeps the underlying file handles
+    open; callers that process many files in one run should call
+    _open_reader.cache_clear() when finished to release them.
+    """
+    return PdfReader(open(path, "rb", buffering=1 << 20), strict=False)
+
+
+# serialized clean-OA templates, keyed by path; bounded LRU like _open_reader
+_TEMPLATE_CACHE_MAX = 8
+_template_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _clone_template(clean_oa_path: Path) -> PdfWriter:
+    """Returns a fresh PdfWriter cloned from the clean operating agreement.
+
+    The first clone of a template is serialized once into an in-memory byte
+    cache; later clones of the same template re-parse those bytes instead of
+    the file on disk, which pays off when one clean OA is compiled repeatedly
+    in a batch. The cache keeps the most recent _TEMPLATE_CACHE_MAX templates.
+    """
+    key = str(clean_oa_path)
+    data = _template_cache.get(key)
+    if data is None:
+        output_file = PdfWriter(clone_from=_open_reader(key))
+        buffer = BytesIO()
+        output_file.write(buffer)
+        _template_cache[key] = buffer.getvalue()
+        if len(_template_cache) > _TEMPLATE_CACHE_MAX:
+            _template_cache.popitem(last=False)
+        return output_file
+    _template_cache.move_to_end(key)
+    return PdfWriter(clone_from=PdfReader(BytesIO(data), strict=False))
+
+
+def _parse_and_serialize(
+    input_file_full_path: Path,
+    page_number_to_extract: int,
+) -> Tuple[str, Optional[bytes]]:
+    """Extracts a single page from one PDF and serializes it to bytes in memory.
+
+    Runs in a worker process; exceptions are caught and returned as a status
+    message so a single bad file doesn't halt the batch. Returns ("ok", data)
+    on success, or (reason, None) when the file was skipped or failed.
+    """
+    try:
+        input_file = _open_reader(str(input_file_full_path))
+        # bind the page tree once; every .pages access walks pypdf's
+        # attribute chain
+        pages = input_file.pages
+        # check if page exists
+        if not 0 <= page_number_to_extract < len(pages):
+            return f"Skipped (page out of range): {input_file_full_path}", None
+        output_file = PdfWriter()
+        output_file.add_page(pages[page_number_to_extract])
+        buffer = BytesIO()
+        output_file.write(buffer)
+        return "ok", buffer.getvalue()
+    except Exception as e:
+        return f"Error processing {input_file_full_path}: {e}", None
+
+
+async def _extract_pages_async(
+    executor: ProcessPoolExecutor,
+    paths: List[Path],
+    page_number_to_extract: int,
+    output_file_dir: Path,
+    output_file_name_prefix: str,
+) -> None:
+    """Extracts pages on the process pool and writes the results concurrently.
+
+    Parsing runs on the worker processes while the serialized bytes are
+    written out via asyncio.to_thread, so one file's write flush overlaps the
+    next file's parse. The semaphore caps the in-flight jobs (and thus the
+    buffered output bytes) at 8.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(8)
+
+    async def extract_one(input_file_full_path: Path) -> None:
+        async with semaphore:
+            status, data = await loop.run_in_executor(
+                executor,
+                partial(
+                    _parse_and_serialize,
+                    input_file_full_path,
+                    page_number_to_extract,
+                ),
+            )
+            if data is None:
+                if status.startswith("Error"):
+                    logger.warning(status)
+                else:
+                    logger.debug(status)
+                return
+            output_file_full_path = output_file_dir / (
+                output_file_name_prefix + input_file_full_path.name
+            )
+            try:
+                await asyncio.to_thread(output_file_full_path.write_bytes, data)
+            except Exception as e:
+                logger.warning(f"Error processing {input_file_full_path}: {e}")
+                return
+            logger.debug(f"Created: {output_file_full_path}")
+
+    await asyncio.gather(*(extract_one(p) for p in paths))
+
 
 def extract_same_page_from_pdfs(
     input_file_dir_arg: Union[Path, str],
@@ -29,46 +206,36 @@ def extract_same_page_from_pdfs(
     page_number_to_extract = page_number_to_extract_arg
     output_file_name_prefix = output_file_name_prefix_arg
 
-    print("Input file directory: " + str(input_file_dir))
-    print("Output file directory: " + str(output_file_dir))
-    print("Output file name prefix: " + output_file_name_prefix)
-    print(
-        "Page number to extract: "
-        + str(page_number_to_extract)
-        + f" (PDF page {page_number_to_extract + 1})\n"
+    logger.info(
+        f"Input file directory: {input_file_dir}\n"
+        f"Output file directory: {output_file_dir}\n"
+        f"Output file name prefix: {output_file_name_prefix}\n"
+        f"Page number to extract: {page_number_to_extract}"
+        f" (PDF page {page_number_to_extract + 1})\n"
     )
 
-    # create output directory if it doesn't exist
-    if not output_file_dir.exists():
-        output_file_dir.mkdir(parents=True, exist_ok=True)
-        print("Created: " + str(output_file_dir))
+    # create output directory if it doesn't exist (mkdir handles EEXIST itself)
+    output_file_dir.mkdir(parents=True, exist_ok=True)
 
-    # iterate through input files (sorted for consistency)
-    print("Starting PDF extraction...")
-    print("Extracting page " + str(page_number_to_extract) + " from PDFs...")
-    for input_file_full_path in sorted(input_file_dir.glob("*.pdf")):
-        try:
-            with open(input_file_full_path, "rb") as f:
-                input_file = PdfReader(f)
-                output_file = PdfWriter()
-                # check if page exists
-                if page_number_to_extract < 0 or page_number_to_extract >= len(
-                    input_file.pages
-                ):
-                    print(f"Skipped (page out of range): {input_file_full_path}")
-                    continue
-                page = input_file.pages[page_number_to_extract]
-                output_file.add_page(page)
-                output_file_full_path = output_file_dir / (
-                    output_file_name_prefix + input_file_full_path.name
-                )
-                with open(output_file_full_path, "wb") as output_stream:
-                    output_file.write(output_stream)
-                print("Created: " + str(output_file_full_path))
-        except Exception as e:
-            print(f"Error processing {input_file_full_path}: {e}")
-
-    print("\nPDF extraction complete.")
+    # process input files in parallel (sorted for consistency); pypdf parsing
+    # is CPU-bound, so a process pool scales with core count where threads
+    # would serialize on the GIL
+    logger.info(
+        f"Starting PDF extraction...\nExtracting page {page_number_to_extract} from PDFs..."
+    )
+    paths = _list_pdfs(input_file_dir)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        asyncio.run(
+            _extract_pages_async(
+                executor,
+                paths,
+                page_number_to_extract,
+                output_file_dir,
+                output_file_name_prefix,
+            )
+        )
+
+    logger.info("\nPDF extraction complete.")
 
     return output_file_dir
 
@@ -94,41 +261,99 @@ def combine_pdfs_in_dir(
         output_file_dir = input_file_dir.parent / output_file_dir_arg
     output_file_name = output_file_name_arg
 
-    print("Input file directory: " + str(input_file_dir))
-    print("Output file directory: " + str(output_file_dir))
-    print("Output file name: " + output_file_name + "\n")
+    logger.info(
+        f"Input file directory: {input_file_dir}\n"
+        f"Output file directory: {output_file_dir}\n"
+        f"Output file name: {output_file_name}\n"
+    )
 
-    # create output directory if it doesn't exist
-    if not output_file_dir.exists():
-        output_file_dir.mkdir(parents=True, exist_ok=True)
-        print("Created: " + str(output_file_dir))
+    # create output directory if it doesn't exist (mkdir handles EEXIST itself)
+    output_file_dir.mkdir(parents=True, exist_ok=True)
 
     output_file = PdfWriter()
 
     # iterate through input files (sorted for consistency)
-    print("Starting PDF combination...")
-    print("Combining PDFs...")
-    for input_file_full_path in sorted(input_file_dir.glob("*.pdf")):
+    logger.info("Starting PDF combination...\nCombining PDFs...")
+    paths = _list_pdfs(input_file_dir)
+    for input_file_full_path, data in _prefetch_bytes(paths):
         try:
-            with open(input_file_full_path, "rb") as f:
-                input_file = PdfReader(f)
-                for page in input_file.pages:
-                    output_file.add_page(page)
-            print("Added: " + str(input_file_full_path))
+            # bulk-append grafts the reader's whole object graph in one
+            # pass instead of deep-cloning page by page; each file is read
+            # exactly once here, so the prefetched bytes bypass _open_reader
+            output_file.append(
+                PdfReader(BytesIO(data), strict=False), import_outline=False
+            )
+            logger.debug(f"Added: {input_file_full_path}")
         except Exception as e:
-            print(f"Error processing {input_file_full_path}: {e}")
+            logger.warning(f"Error processing {input_file_full_path}: {e}")
 
     # write output file to disk
     output_file_full_path = output_file_dir / output_file_name
-    with open(output_file_full_path, "wb") as output_stream:
+    with open(output_file_full_path, "wb", buffering=1 << 20) as output_stream:
         output_file.write(output_stream)
 
-    print("Created: " + str(output_file_full_path))
-    print("\nPDF combination complete.")
+    logger.info(f"Created: {output_file_full_path}")
+    logger.info("\nPDF combination complete.")
 
     return output_file_full_path
 
 
+def _collect_investor_sig_pages(
+    input_file_dir: Path,
+    page_number_to_extract: int,
+) -> PdfWriter:
+    """Extracts the same page from each PDF in a directory into one in-memory writer.
+
+    Fuses the extract and combine steps of the pipeline: each signature page is
+    appended directly into the shared writer, so the page objects are cloned
+    once instead of once per pass.
+    """
+    output_file = PdfWriter()
+    for input_file_full_path in _list_pdfs(input_file_dir):
+        try:
+            input_file = _open_reader(str(input_file_full_path))
+            # bind the page tree once; every .pages access walks pypdf's
+            # attribute chain
+            pages = input_file.pages
+            # check if page exists
+            if not 0 <= page_number_to_extract < len(pages):
+                logger.debug(f"Skipped (page out of range): {input_file_full_path}")
+                continue
+            output_file.add_page(pages[page_number_to_extract])
+        except Exception as e:
+            logger.warning(f"Error processing {input_file_full_path}: {e}")
+    return output_file
+
+
+def _slice_to_writer(
+    input_file_path: Union[Path, str],
+    start_page: int = 0,
+    end_page: int = -1,
+) -> PdfWriter:
+    """Slices a page range from a PDF into an in-memory PdfWriter.
+
+    In-memory counterpart of slice_pdf; the caller decides whether the result
+    is serialized to disk or appended into a larger document.
+    """
+    output_file = PdfWriter()
+    input_file = _open_reader(str(input_file_path))
+    num_pages = len(input_file.pages)
+    # handle end_page == -1 as "to the end", clamped to the valid range
+    if end_page in (-1, None):
+        end_page_actual = num_pages
+    else:
+        end_page_actual = min(end_page, num_pages)
+    start_page_actual = max(0, start_page)
+    # bulk-append streams the whole range in one pass instead of
+    # materializing a page list and cloning page by page
+    output_file.append(
+        input_file,
+        pages=(start_page_actual, end_page_actual),
+        import_outline=False,
+    )
+    return output_file
+
+
 def slice_pdf(
     input_file_path: Union[Path, str],
     start_page: int = 0,
@@ -154,39 +379,25 @@ def slice_pdf(
         output_file_dir = input_file_path.parent / output_file_dir_arg
     output_file_name = output_file_name_arg
 
-    print("Input file path: " + str(input_file_path))
-    print("Output file directory: " + str(output_file_dir))
-    print("Output file name: " + output_file_name + "\n")
-
-    # create output directory if it doesn't exist
-    if not output_file_dir.exists():
-        output_file_dir.mkdir(parents=True, exist_ok=True)
-        print("Created: " + str(output_file_dir))
+    logger.info(
+        f"Input file path: {input_file_path}\n"
+        f"Output file directory: {output_file_dir}\n"
+        f"Output file name: {output_file_name}\n"
+    )
 
-    output_file = PdfWriter()
+    # create output directory if it doesn't exist (mkdir handles EEXIST itself)
+    output_file_dir.mkdir(parents=True, exist_ok=True)
 
-    # open input file
-    with open(input_file_path, "rb") as f:
-        input_file = PdfReader(f)
-        num_pages = len(input_file.pages)
-        # handle end_page == -1 as "to the end"
-        if end_page == -1 or end_page is None:
-            end_page_actual = num_pages
-        else:
-            end_page_actual = end_page
-        # clamp start_page and end_page_actual to valid range
-        start_page = max(0, start_page)
-        end_page_actual = min(num_pages, end_page_actual)
-        for page in input_file.pages[start_page:end_page_actual]:
-            output_file.add_page(page)
+    # slice in memory, then serialize once
+    output_file = _slice_to_writer(input_file_path, start_page, end_page)
 
     # write output file to disk
     output_file_full_path = output_file_dir / output_file_name
-    with open(output_file_full_path, "wb") as output_stream:
+    with open(output_file_full_path, "wb", buffering=1 << 20) as output_stream:
         output_file.write(output_stream)
 
-    print("Created: " + str(output_file_full_path))
-    print("\nPDF slicing complete.")
+    logger.info(f"Created: {output_file_full_path}")
+    logger.info("\nPDF slicing complete.")
 
     return output_file_full_path
 
@@ -205,41 +416,42 @@ def combine_pdfs_from_list(
     """
 
     # Argument validation
-    input_file_list = [Path(f) for f in input_file_list_arg]
     output_file_dir = Path(output_file_dir_arg)
     output_file_name = output_file_name_arg
 
-    print("Input file list: " + str(input_file_list))
-    print("Output file directory: " + str(output_file_dir))
-    print("Output file name: " + output_file_name + "\n")
+    # %s-style so the list is only stringified when debug output is on
+    logger.debug("Input file list: %s", input_file_list_arg)
+    logger.info(
+        f"Output file directory: {output_file_dir}\n"
+        f"Output file name: {output_file_name}\n"
+    )
 
-    # create output directory if it doesn't exist
-    if not output_file_dir.exists():
-        output_file_dir.mkdir(parents=True, exist_ok=True)
-        print("Created: " + str(output_file_dir))
+    # create output directory if it doesn't exist (mkdir handles EEXIST itself)
+    output_file_dir.mkdir(parents=True, exist_ok=True)
 
     output_file = PdfWriter()
 
-    # iterate through input files
-    print("Starting PDF combination...")
-    print("Combining PDFs...")
-    for input_file_full_path in input_file_list:
+    # iterate through input files, converting each path as it is consumed
+    logger.info("Starting PDF combination...\nCombining PDFs...")
+    for raw_input_file_path in input_file_list_arg:
+        input_file_full_path = Path(raw_input_file_path)
         try:
-            with open(input_file_full_path, "rb") as f:
-                input_file = PdfReader(f)
-                for page in input_file.pages:
-                    output_file.add_page(page)
-            print("Added: " + str(input_file_full_path))
+            # bulk-append grafts the file's whole object graph in one pass
+            # instead of deep-cloning page by page
+            output_file.append(
+                _open_reader(str(input_file_full_path)), import_outline=False
+            )
+            logger.debug(f"Added: {input_file_full_path}")
         except Exception as e:
-            print(f"Error processing {input_file_full_path}: {e}")
+            logger.warning(f"Error processing {input_file_full_path}: {e}")
 
     # write output file to disk
     output_file_full_path = output_file_dir / output_file_name
-    with open(output_file_full_path, "wb") as output_stream:
+    with open(output_file_full_path, "wb", buffering=1 << 20) as output_stream:
         output_file.write(output_stream)
 
-    print("Created: " + str(output_file_full_path))
-    print("\nPDF combination complete.")
+    logger.info(f"Created: {output_file_full_path}")
+    logger.info("\nPDF combination complete.")
 
     return output_file_full_path
 
@@ -264,86 +476,69 @@ def compile_final_signed_operating_agreement(
     clean_oa_path = Path(clean_oa_path)
     investor_signed_oas_dir = Path(investor_signed_oas_dir)
 
-    print("Clean operating agreement path: " + str(clean_oa_path))
-    print(
-        "Investor signed operating agreements directory: "
-        + str(investor_signed_oas_dir)
-    )
-    print(
-        "Investor signature page number: "
-        + str(investor_sig_page_number)
-        + f" (PDF page {investor_sig_page_number + 1})"
-    )
-    print(
-        "Manager signature page number: "
-        + str(manager_sig_page_number)
-        + f" (PDF page {manager_sig_page_number + 1})\n"
-    )
-
-    # extract signature pages from PDFs
-    sig_pages_output_dir = extract_same_page_from_pdfs(
-        investor_signed_oas_dir,
-        investor_sig_page_number,
+    logger.info(
+        f"Clean operating agreement path: {clean_oa_path}\n"
+        f"Investor signed operating agreements directory: {investor_signed_oas_dir}\n"
+        f"Investor signature page number: {investor_sig_page_number}"
+        f" (PDF page {investor_sig_page_number + 1})\n"
+        f"Manager signature page number: {manager_sig_page_number}"
+        f" (PDF page {manager_sig_page_number + 1})\n"
     )
 
-    # combine signature pages into a single PDF
-    combined_sig_pages_path = combine_pdfs_in_dir(sig_pages_output_dir)
+    # build every component in memory; only the final document is serialized,
+    # so no intermediate PDF is written to disk and re-parsed
 
-    # extract pages before signature pages from clean operating agreement
-    oa_beginning_path = slice_pdf(
-        clean_oa_path,
-        0,
-        min(investor_sig_page_number, manager_sig_page_number),
-        output_file_dir_arg=None,
-        output_file_name_arg="OA Beginning.pdf",
+    # extract and combine the investor signature pages in a single pass
+    logger.info(
+        f"Starting PDF extraction...\nExtracting page {investor_sig_page_number} from PDFs..."
     )
-
-    # extract pages after signature pages from clean operating agreement
-    oa_ending_path = slice_pdf(
-        clean_oa_path,
-        max(investor_sig_page_number, manager_sig_page_number) + 1,
-        -1,
-        output_file_dir_arg=None,
-        output_file_name_arg="OA Ending.pdf",
-    )
-
-    # extract manager signature page from clean operating agreement
-    manager_sig_page_path = slice_pdf(
-        clean_oa_path,
-        manager_sig_page_number,
-        manager_sig_page_number + 1,
-        output_file_dir_arg=None,
-        output_file_name_arg="Manager Signature Page.pdf",
+    combined_sig_pages = _collect_investor_sig_pages(
+        investor_signed_oas_dir,
+        investor_sig_page_number,
     )
 
-    # combine clean operating agreement pages with signature pages
-    doc_components_list = []
+    # start from a wholesale clone of the clean operating agreement, which
+    # copies fonts, resources, and shared dictionaries in one structural
+    # pass, then splice the signature pages into place
+    logger.info("Combining PDFs...")
+    final = _clone_template(clean_oa_path)
+    first_sig = min(investor_sig_page_number, manager_sig_page_number)
+    last_sig = max(investor_sig_page_number, manager_sig_page_number)
     if manager_sig_page_number < investor_sig_page_number:
-        doc_components_list = [
-            oa_beginning_path,
-            manager_sig_page_path,
-            combined_sig_pages_path,
-            oa_ending_path,
-        ]
+        # the manager page stays in place; drop everything after it up to
+        # and including the investor page, then insert the signed investor
+        # pages right after the manager page
+        delete_start, delete_stop = first_sig + 1, last_sig + 1
+        insert_at = first_sig + 1
     else:
-        doc_components_list = [
-            oa_beginning_path,
-            combined_sig_pages_path,
-            manager_sig_page_path,
-            oa_ending_path,
-        ]
-
-    # combine all components into final PDF
+        # drop from the investor page up to the manager page, shifting the
+        # manager page down; the signed investor pages go right before it
+        delete_start, delete_stop = first_sig, last_sig
+        insert_at = first_sig
+    # skip the page-tree rewrite when the range is empty (e.g. the investor
+    # and manager signatures share a page)
+    if delete_start < delete_stop:
+        del final.pages[delete_start:delete_stop]
+
+    # merge the combined investor signature pages at the insertion point,
+    # unless there were none to collect
+    if len(combined_sig_pages.pages) > 0:
+        buffer = BytesIO()
+        combined_sig_pages.write(buffer)
+        buffer.seek(0)
+        final.merge(insert_at, buffer, import_outline=False)
+
+    # write the final document to disk (the only write in the pipeline)
     if output_file_name is None:
         output_file_name = clean_oa_path.stem + " FINAL COMBINED.pdf"
+    combined_pdf_path = clean_oa_path.parent / output_file_name
+    with open(combined_pdf_path, "wb", buffering=1 << 20) as output_stream:
+        final.write(output_stream)
 
-    combined_pdf_path = combine_pdfs_from_list(
-        doc_components_list,
-        output_file_dir_arg=clean_oa_path.parent,
-        output_file_name_arg=output_file_name,
-    )
+    # release the file handles held by the reader cache
+    _open_reader.cache_clear()
 
-    print("Final Combined PDF: " + str(combined_pdf_path) + "\n")
+    logger.info(f"Final Combined PDF: {combined_pdf_path}\n")
 
     return combined_pdf_path
 
@@ -351,7 +546,10 @@ def compile_final_signed_operating_agreement(
 @app.command()
 def extract(
     input_dir: Path = typer.Argument(
-        ..., help="Directory containing PDFs to extract from."
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Directory containing PDFs to extract from.",
     ),
     page_number: int = typer.Option(0, help="Zero-indexed page number to extract."),
     sig_pages_output_dir: str = typer.Option(
@@ -372,7 +570,9 @@ def extract(
 
 @app.command()
 def combine(
-    input_dir: Path = typer.Argument(..., help="Directory containing PDFs to combine."),
+    input_dir: Path = typer.Argument(
+        ..., exists=True, file_okay=False, help="Directory containing PDFs to combine."
+    ),
     sig_pages_output_dir: Optional[str] = typer.Option(
         None, help="Directory to save the combined PDF."
     ),
@@ -390,7 +590,9 @@ def combine(
 
 @app.command()
 def slice(
-    input_file: Path = typer.Argument(..., help="PDF file to slice."),
+    input_file: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="PDF file to slice."
+    ),
     start_page: int = typer.Option(0, help="Zero-indexed start page."),
     end_page: int = typer.Option(
         1, help="Zero-indexed end page (non-inclusive, -1 for end)."
@@ -412,7 +614,9 @@ def slice(
 
 @app.command()
 def combine_list(
-    input_files: List[Path] = typer.Argument(..., help="List of PDF files to combine."),
+    input_files: List[Path] = typer.Argument(
+        ..., exists=True, dir_okay=False, help="List of PDF files to combine."
+    ),
     sig_pages_output_dir: Path = typer.Argument(
         ..., help="Directory to save the combined PDF."
     ),
@@ -429,10 +633,16 @@ def combine_list(
 @app.command()
 def compile_final(
     clean_oa: Path = typer.Argument(
-        ..., help="Path to the clean operating agreement PDF."
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="Path to the clean operating agreement PDF.",
     ),
     signed_dir: Path = typer.Argument(
-        ..., help="Directory containing signed operating agreements."
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Directory containing signed operating agreements.",
     ),
     investor_sig_page: int = typer.Argument(
         ..., help="Zero-indexed page number of investor signature."
@@ -448,3 +658,64 @@ def compile_final(
         investor_sig_page_number=investor_sig_page,
         manager_sig_page_number=manager_sig_page,
     )
+
+
+def _compile_one_star(job: Tuple[Path, Path, int, int]) -> str:
+    """Compiles one final signed operating agreement from an argument tuple.
+
+    Runs in a worker process; exceptions are caught and returned as a status
+    message so a single bad fund doesn't halt the batch.
+    """
+    clean_oa_path, signed_dir, investor_sig_page, manager_sig_page = job
+    try:
+        result = compile_final_signed_operating_agreement(
+            clean_oa_path=clean_oa_path,
+            investor_signed_oas_dir=signed_dir,
+            investor_sig_page_number=investor_sig_page,
+            manager_sig_page_number=manager_sig_page,
+        )
+        return f"Compiled: {result}"
+    except Exception as e:
+        return f"Error processing {clean_oa_path}: {e}"
+
+
+@app.command()
+def compile_many(
+    clean_oa_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Directory of clean operating agreement PDFs.",
+    ),
+    signed_parent_dir: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        help="Parent directory with one signed-OA directory per clean OA, "
+        "named after the clean OA's stem.",
+    ),
+    investor_sig_page: int = typer.Argument(
+        ..., help="Zero-indexed page number of investor signature."
+    ),
+    manager_sig_page: int = typer.Argument(
+        ..., help="Zero-indexed page number of manager signature."
+    ),
+    workers: int = typer.Option(os.cpu_count(), help="Number of worker processes."),
+):
+    """Compile final signed operating agreements for a whole directory of clean OAs.
+
+    Each clean OA is matched to its signed-OA directory and compiled on a
+    process pool, so one interpreter (and one pypdf import) is amortized over
+    many funds instead of paying process startup per run.
+    """
+    jobs = [
+        (clean_oa_path, signed_parent_dir / clean_oa_path.stem, investor_sig_page,
+         manager_sig_page)
+        for clean_oa_path in _list_pdfs(clean_oa_dir)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(_compile_one_star, jobs):
+            if result.startswith("Error"):
+                logger.warning(result)
+            else:
+                logger.info(result)
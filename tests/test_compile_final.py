@@ -57,7 +57,7 @@ def test_compile_final_signed_operating_agreement(tmp_path: Path):
     assert result_pdf.exists(), "Result PDF was not created"
 
     # Check the number of pages in the result PDF
-    with open(result_pdf, "rb") as f:
-        reader = PdfReader(f)
+    with open(result_pdf, "rb", buffering=1 << 20) as f:
+        reader = PdfReader(f, strict=False)
         expected_pages = 44  # Adjust if fixture changes
         assert len(reader.pages) == expected_pages
@@ -0,0 +1,125 @@
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+from pypdf import PdfReader, PdfWriter
+
+from extract_pdf_pages.main import (
+    compile_final_signed_operating_agreement,
+    compile_many,
+)
+
+PAGE_HEIGHT = 792
+
+# a 10-page clean operating agreement; page i has width 100 + i
+CLEAN_WIDTHS = list(range(100, 110))
+# three signed investor OAs; every page of investor k has width 300 + k
+INVESTOR_WIDTHS = [300, 301, 302]
+
+
+def _make_pdf(path: Path, widths: Sequence[int]) -> None:
+    """Writes a PDF whose pages are blank but identifiable by their width."""
+    writer = PdfWriter()
+    for width in widths:
+        writer.add_blank_page(width=width, height=PAGE_HEIGHT)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def _page_widths(path: Path) -> List[int]:
+    """Reads back each page's width so the output page order can be asserted."""
+    with open(path, "rb") as f:
+        return [
+            int(page.mediabox.width) for page in PdfReader(f, strict=False).pages
+        ]
+
+
+def _make_fixtures(tmp_path: Path) -> Tuple[Path, Path]:
+    """Builds a clean OA and a directory of signed OAs with width-tagged pages."""
+    clean_oa = tmp_path / "Clean OA.pdf"
+    _make_pdf(clean_oa, CLEAN_WIDTHS)
+    signed_dir = tmp_path / "Indiv"
+    signed_dir.mkdir()
+    for k, width in enumerate(INVESTOR_WIDTHS):
+        _make_pdf(signed_dir / f"Investor {k}.pdf", [width] * 10)
+    return clean_oa, signed_dir
+
+
+def test_compile_manager_before_investor(tmp_path: Path):
+    """Manager page 4, investor page 5: manager page stays ahead of the
+    investor signature pages."""
+    clean_oa, signed_dir = _make_fixtures(tmp_path)
+
+    result_pdf = compile_final_signed_operating_agreement(
+        clean_oa_path=clean_oa,
+        investor_signed_oas_dir=signed_dir,
+        investor_sig_page_number=5,
+        manager_sig_page_number=4,
+    )
+
+    # beginning + manager page + investor sig pages + ending
+    expected = CLEAN_WIDTHS[:5] + INVESTOR_WIDTHS + CLEAN_WIDTHS[6:]
+    assert _page_widths(result_pdf) == expected
+
+
+def test_compile_investor_before_manager(tmp_path: Path):
+    """Investor page 4, manager page 5: investor signature pages come first,
+    followed by the manager page."""
+    clean_oa, signed_dir = _make_fixtures(tmp_path)
+
+    result_pdf = compile_final_signed_operating_agreement(
+        clean_oa_path=clean_oa,
+        investor_signed_oas_dir=signed_dir,
+        investor_sig_page_number=4,
+        manager_sig_page_number=5,
+    )
+
+    # beginning + investor sig pages + manager page + ending
+    expected = CLEAN_WIDTHS[:4] + INVESTOR_WIDTHS + CLEAN_WIDTHS[5:]
+    assert _page_widths(result_pdf) == expected
+
+
+def test_compile_shared_sig_page(tmp_path: Path):
+    """Investor and manager signatures on the same page: no clean pages are
+    dropped and the investor pages are inserted ahead of it."""
+    clean_oa, signed_dir = _make_fixtures(tmp_path)
+
+    result_pdf = compile_final_signed_operating_agreement(
+        clean_oa_path=clean_oa,
+        investor_signed_oas_dir=signed_dir,
+        investor_sig_page_number=5,
+        manager_sig_page_number=5,
+    )
+
+    expected = CLEAN_WIDTHS[:5] + INVESTOR_WIDTHS + CLEAN_WIDTHS[5:]
+    assert _page_widths(result_pdf) == expected
+
+
+def test_compile_many_matches_signed_dirs_by_stem(tmp_path: Path):
+    """compile_many pairs each clean OA with the signed-OA directory named
+    after its stem and compiles them all."""
+    clean_oa_dir = tmp_path / "clean"
+    clean_oa_dir.mkdir()
+    signed_parent_dir = tmp_path / "signed"
+    signed_parent_dir.mkdir()
+    # distinct investor widths per fund so a stem mismatch would show up
+    fund_investor_widths = {"Fund A": [300, 301], "Fund B": [400, 401]}
+    for fund, widths in fund_investor_widths.items():
+        _make_pdf(clean_oa_dir / f"{fund}.pdf", CLEAN_WIDTHS)
+        fund_signed_dir = signed_parent_dir / fund
+        fund_signed_dir.mkdir()
+        for k, width in enumerate(widths):
+            _make_pdf(fund_signed_dir / f"Investor {k}.pdf", [width] * 10)
+
+    compile_many(
+        clean_oa_dir=clean_oa_dir,
+        signed_parent_dir=signed_parent_dir,
+        investor_sig_page=5,
+        manager_sig_page=4,
+        workers=2,
+    )
+
+    for fund, widths in fund_investor_widths.items():
+        result_pdf = clean_oa_dir / f"{fund} FINAL COMBINED.pdf"
+        assert result_pdf.exists(), f"missing output for {fund}"
+        expected = CLEAN_WIDTHS[:5] + widths + CLEAN_WIDTHS[6:]
+        assert _page_widths(result_pdf) == expected